@@ -1,147 +1,529 @@
+import io
 import os
 import re
+import csv
+import gzip
 import json
 import time
 import argparse
+import tempfile
+import threading
+import multiprocessing
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import date
-from typing import Optional, Dict, Any, Iterator, List, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union, BinaryIO, Callable, TypeVar
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ModuleNotFoundError:
     raise SystemExit("Missing dependency: requests. Install with 'pip install requests'")
 
+try:
+    from lxml import etree as ET
+except ModuleNotFoundError:
+    raise SystemExit("Missing dependency: lxml. Install with 'pip install lxml'")
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pa_parquet
+except ModuleNotFoundError:
+    pa = None
+
+try:
+    import zstandard as zstd
+except ModuleNotFoundError:
+    zstd = None
+
 
 BASE = "https://api.govinfo.gov"
 
+T = TypeVar("T")
+
+FIELD_ORDER = [
+    'date', 'chamber', 'speaker', 'bioguide_id', 'title', 'page', 'package_id', 'granule_id', 'text'
+]
+
+_SPEECH_TAGS = ('{*}speaking', '{*}p')
+_PAGE_RE = re.compile(r'(Pg[SH]\d+(?:-\d+)?)')
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+
+    def configure(self, rate: float, burst: int) -> None:
+        with self._lock:
+            self.max_rate = self.rate = rate
+            self.burst = burst
+            self.tokens = float(burst)
+            self.updated = time.monotonic()
+            self.paused_until = 0.0
+            self.hold_until = 0.0
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def throttle(self, retry_after: Optional[float]) -> None:
+        # Multiplicative decrease: halve the refill rate and hold it there for a minute.
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            self.hold_until = now + 60
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+    def recover(self) -> None:
+        # Additive increase back towards the configured rate once the hold expires.
+        with self._lock:
+            if self.rate < self.max_rate and time.monotonic() >= self.hold_until:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+_limiter = _TokenBucket(rate=5.0, burst=10)
+
+
+class _ThrottleRetry(Retry):
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and response.status in (429, 503):
+            _limiter.throttle(self.get_retry_after(response))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        _limiter.acquire()
+        r = super().send(request, **kwargs)
+        if r.status_code < 400:
+            _limiter.recover()
+        return r
+
+
+def _mount_adapter(session: requests.Session, pool_maxsize: int = 32) -> None:
+    retry = _ThrottleRetry(total=6, backoff_factor=0.5, backoff_jitter=0.3, status_forcelist=[429, 502, 503, 504],
+                           allowed_methods=frozenset(["GET"]), respect_retry_after_header=True, raise_on_status=False)
+    adapter = _RateLimitedAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _make_session() -> requests.Session:
+    session = requests.Session()
+    _mount_adapter(session)
+    return session
+
+
+_session = _make_session()
+
 
 def compact_whitespace(s: str) -> str:
-    import re as _re
-    return _re.sub(r"\s+", " ", (s or "").strip())
+    return " ".join((s or "").split())
+
+
+def _dumps(rec: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(rec)
+    return json.dumps(rec, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def _get(path: str, api_key: str, params: Optional[Dict[str, Any]] = None, stream: bool = False):
     params = dict(params or {})
     params["api_key"] = api_key
-    for attempt in range(6):
-        r = requests.get(BASE + path, params=params, timeout=60, stream=stream)
-        if r.status_code in (429, 502, 503, 504):
-            time.sleep(min(2 ** attempt, 10))
-            continue
-        r.raise_for_status()
-        return r
+    r = _session.get(BASE + path, params=params, timeout=60, stream=stream)
     r.raise_for_status()
+    return r
 
 
-def iter_crec_packages(api_key: str, start_date: str, end_date: str, page_size: int = 100, rate_delay: float = 0.2) -> Iterator[Dict[str, Any]]:
+def _iter_pages(path: str, api_key: str, params: Dict[str, Any], key: str, page_size: int,
+                limit: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
     offset = 0
     while True:
-        resp = _get("/collections/CREC", api_key, params={
-            "startDate": start_date,
-            "endDate": end_date,
-            "pageSize": page_size,
-            "offset": offset,
-        }).json()
-        items = resp.get("packages", []) or []
+        resp = _loads(_get(path, api_key, params={**params, "pageSize": page_size, "offset": offset}).content)
+        items = resp.get(key, []) or []
         if not items:
             break
-        for p in items:
-            yield p
+        yield items
         if len(items) < page_size:
             break
         offset += page_size
-        time.sleep(rate_delay)
+        if limit and offset >= limit:
+            break
 
 
-def iter_granules(api_key: str, package_id: str, page_size: int = 100, rate_delay: float = 0.2) -> Iterator[Dict[str, Any]]:
-    offset = 0
-    while True:
-        resp = _get(f"/packages/{package_id}/granules", api_key, params={
-            "pageSize": page_size,
-            "offset": offset,
-        }).json()
-        items = resp.get("granules", []) or []
-        if not items:
-            break
-        for g in items:
-            yield g
-        if len(items) < page_size:
-            break
-        offset += page_size
-        time.sleep(rate_delay)
+def _prefetch(pages: Iterator[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+    # Request page n+1 in the background once the caller has taken page n, so at
+    # most one listing call is ever made ahead of what the caller consumes.
+    fetcher = ThreadPoolExecutor(max_workers=1)
+    fut = fetcher.submit(next, pages, None)
+    try:
+        while True:
+            page = fut.result()
+            if page is None:
+                return
+            fut = fetcher.submit(next, pages, None)
+            yield page
+    finally:
+        fut.cancel()
+        fetcher.shutdown(wait=False)
+
+
+def iter_crec_packages(api_key: str, start_date: str, end_date: str, page_size: int = 100,
+                       limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    pages = _iter_pages("/collections/CREC", api_key, {
+        "startDate": start_date,
+        "endDate": end_date,
+    }, "packages", page_size, limit)
+    for items in _prefetch(pages):
+        yield from items
 
 
-def get_granule_summary(api_key: str, package_id: str, granule_id: str) -> Dict[str, Any]:
-    return _get(f"/packages/{package_id}/granules/{granule_id}/summary", api_key).json()
+def iter_granules(api_key: str, package_id: str, page_size: int = 100,
+                  limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    pages = _iter_pages(f"/packages/{package_id}/granules", api_key, {}, "granules", page_size, limit)
+    for items in _prefetch(pages):
+        yield from items
 
 
-def fetch_granule_text(api_key: str, package_id: str, granule_id: str) -> Tuple[Optional[str], Dict[str, Any]]:
-    summary = get_granule_summary(api_key, package_id, granule_id)
+def _cache_path(cache_dir: str, package_id: str, granule_id: str, suffix: str) -> str:
+    return os.path.join(cache_dir, package_id, granule_id + suffix)
+
+
+def _cache_fresh(path: str, cache_ttl: Optional[float]) -> bool:
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return False
+    return cache_ttl is None or time.time() - mtime < cache_ttl
+
+
+@contextmanager
+def _atomic_write(path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class _TeeReader:
+    # Copies everything read from src into sink, so a download can be parsed and
+    # cached in the same pass.
+    def __init__(self, src: BinaryIO, sink: BinaryIO):
+        self._src = src
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._src.read(None if size is None or size < 0 else size)
+        self._sink.write(data)
+        return data
+
+
+def _read_body(url: str, params: Optional[Dict[str, Any]], cache_path: Optional[str],
+               cache_ttl: Optional[float], consume: Callable[[BinaryIO], T]) -> T:
+    with _session.get(url, params=params, timeout=90, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        if not cache_path:
+            return consume(r.raw)
+        with _atomic_write(cache_path) as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+            tee = _TeeReader(r.raw, f)
+            result = consume(tee)
+            # The consumer may stop early (e.g. on a parse error); cache the full body anyway.
+            while tee.read(64 * 1024):
+                pass
+        return result
+
+
+def _cached_summary(cache_dir: str, package_id: str, granule_id: str, cache_ttl: Optional[float]) -> Optional[Dict[str, Any]]:
+    path = _cache_path(cache_dir, package_id, granule_id, '.summary.json')
+    if not _cache_fresh(path, cache_ttl):
+        return None
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def get_granule_summary(api_key: str, package_id: str, granule_id: str,
+                        cache_dir: Optional[str] = None, cache_ttl: Optional[float] = None) -> Dict[str, Any]:
+    cached = _cached_summary(cache_dir, package_id, granule_id, cache_ttl) if cache_dir else None
+    if cached is not None:
+        return cached
+    path = _cache_path(cache_dir, package_id, granule_id, '.summary.json') if cache_dir else None
+    summary = _loads(_get(f"/packages/{package_id}/granules/{granule_id}/summary", api_key).content)
+    if path:
+        with _atomic_write(path) as f:
+            f.write(_dumps(summary))
+    return summary
+
+
+def _download_url(summary: Dict[str, Any]) -> Optional[str]:
     dl = summary.get("download") or {}
-    url = dl.get("xmlLink") or dl.get("txtLink") or dl.get("htmLink") or dl.get("htmlLink")
+    return dl.get("xmlLink") or dl.get("txtLink") or dl.get("htmLink") or dl.get("htmlLink")
+
+
+class _DirectXmlProbe:
+    # Tracks, per collection (e.g. "CREC"), whether the deterministic granule XML URL
+    # is served. One 200 confirms it for the run. Until then at most max_misses probes
+    # may fail (in flight or 404) before the collection falls back to the summary path
+    # for good. A 404 after confirmation only affects that granule.
+    def __init__(self, max_misses: int = 3):
+        self._lock = threading.Lock()
+        self.max_misses = max_misses
+        self.supported: set = set()
+        self.misses: Dict[str, int] = {}
+        self.pending: Dict[str, int] = {}
+
+    def begin(self, collection: str) -> Optional[bool]:
+        # None: skip the direct URL; True: known to work; False: unconfirmed probe.
+        with self._lock:
+            if collection in self.supported:
+                return True
+            pending = self.pending.get(collection, 0)
+            if self.misses.get(collection, 0) + pending >= self.max_misses:
+                return None
+            self.pending[collection] = pending + 1
+            return False
+
+    def finish(self, collection: str, served: Optional[bool]) -> None:
+        # Called once per unconfirmed probe; served is None for errors other than 404.
+        with self._lock:
+            self.pending[collection] -= 1
+            if served:
+                if self.misses.get(collection, 0) < self.max_misses:
+                    self.supported.add(collection)
+            elif served is not None and collection not in self.supported:
+                self.misses[collection] = self.misses.get(collection, 0) + 1
+
+
+_direct_xml = _DirectXmlProbe()
+
+
+def _granule_body(api_key: str, package_id: str, granule_id: str, cache_dir: Optional[str],
+                  cache_ttl: Optional[float], consume: Callable[[BinaryIO], T]) -> Tuple[Optional[T], Dict[str, Any]]:
+    cache_path = _cache_path(cache_dir, package_id, granule_id, '.body.xml.gz') if cache_dir else None
+    if cache_path and _cache_fresh(cache_path, cache_ttl):
+        # Served from disk: no request is made, so this says nothing about the direct URL.
+        summary = _cached_summary(cache_dir, package_id, granule_id, cache_ttl) or {}
+        with gzip.open(cache_path, 'rb') as f:
+            return consume(f), summary
+
+    collection = package_id.split('-', 1)[0]
+    known = _direct_xml.begin(collection)
+    if known is not None:
+        url = f"{BASE}/packages/{package_id}/granules/{granule_id}/xml"
+        served: Optional[bool] = None
+        try:
+            result = _read_body(url, {"api_key": api_key}, cache_path, cache_ttl, consume)
+            served = True
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            served = False
+        finally:
+            if known is False:
+                _direct_xml.finish(collection, served)
+        if served:
+            return result, {}
+
+    summary = get_granule_summary(api_key, package_id, granule_id, cache_dir, cache_ttl)
+    url = _download_url(summary)
     if not url:
         return None, summary
-    r = requests.get(url, timeout=90)
-    r.raise_for_status()
-    return r.text, summary
-
-
-def extract_speeches_from_xml(xml_text: str) -> List[Dict[str, Any]]:
-    import xml.etree.ElementTree as ET
-    speeches: List[Dict[str, Any]] = []
+    return _read_body(url, None, cache_path, cache_ttl, consume), summary
+
+
+def fetch_granule_text(api_key: str, package_id: str, granule_id: str,
+                       cache_dir: Optional[str] = None, cache_ttl: Optional[float] = None) -> Tuple[Optional[bytes], Dict[str, Any]]:
+    return _granule_body(api_key, package_id, granule_id, cache_dir, cache_ttl, lambda f: f.read())
+
+
+def stream_granule_speeches(api_key: str, package_id: str, granule_id: str,
+                            cache_dir: Optional[str] = None, cache_ttl: Optional[float] = None) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]:
+    return _granule_body(api_key, package_id, granule_id, cache_dir, cache_ttl, extract_speeches_from_xml)
+
+
+def _granule_lines(api_key: str, package_id: str, pkg_date: Optional[str], g: Dict[str, Any],
+                   cache_dir: Optional[str], cache_ttl: Optional[float],
+                   parse_pool: Optional[ProcessPoolExecutor] = None) -> Optional[List[bytes]]:
+    granule_id = g['granuleId']
+    if parse_pool is None:
+        speeches, summary = stream_granule_speeches(api_key, package_id, granule_id, cache_dir, cache_ttl)
+    else:
+        data, summary = fetch_granule_text(api_key, package_id, granule_id, cache_dir, cache_ttl)
+        speeches = None if data is None else parse_pool.submit(extract_speeches_from_xml, data).result()
+    if speeches is None:
+        return None
+
+    chamber = (g.get('granuleClass') or '').upper()
+    page = parse_page_from_granule_id(granule_id)
+    title = (summary.get('title') or g.get('title') or '').strip()
+    lines: List[bytes] = []
+    for sp in speeches:
+        rec = {
+            'date': pkg_date,
+            'package_id': package_id,
+            'granule_id': granule_id,
+            'chamber': chamber,
+            'page': page,
+            'title': title,
+            **sp,
+        }
+        lines.append(_dumps(rec) + b"\n")
+    return lines
+
+
+def extract_speeches_from_xml(xml_data: Union[bytes, BinaryIO]) -> List[Dict[str, Any]]:
+    if isinstance(xml_data, (bytes, bytearray)):
+        xml_data = io.BytesIO(xml_data)
+    # Records are emitted on 'end' events but must come out in document order, so
+    # each one reserves its slot on 'start'. slots holds, for every open matched
+    # element, its index into speeches/paras (-1 when it is not collected).
+    speeches: List[Optional[Dict[str, Any]]] = []
+    paras: List[Optional[str]] = []
+    slots: List[int] = []
+    speaking_depth = 0
+    found = False
+    context = ET.iterparse(xml_data, events=('start', 'end'), tag=_SPEECH_TAGS, huge_tree=True)
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return speeches
-
-    def tagname(el):
-        return el.tag.split('}')[-1]
-
-    for node in root.iter():
-        if tagname(node) == 'speaking':
-            speaker = node.attrib.get('speaker') or node.attrib.get('speaker_name') or node.attrib.get('who') or ''
-            bioguide = (node.attrib.get('bioGuideId') or node.attrib.get('bioguide_id') or
-                        node.attrib.get('bioGuideID') or node.attrib.get('bioguideId') or '')
-            text = compact_whitespace(''.join(node.itertext()))
-            if text:
-                speeches.append({
-                    'speaker': speaker,
-                    'bioguide_id': bioguide,
-                    'text': text,
-                })
-
-    if not speeches:
-        paras: List[str] = []
-        for node in root.iter():
-            if tagname(node) == 'p':
-                t = compact_whitespace(''.join(node.itertext()))
-                if t:
-                    paras.append(t)
-        if paras:
-            speeches.append({'speaker': '', 'bioguide_id': '', 'text': '\n\n'.join(paras)})
-
-    return speeches
+        for event, node in context:
+            # Only <speaking> and <p> get past the tag filter, so a suffix test is enough.
+            is_speaking = node.tag.endswith('speaking')
+            if event == 'start':
+                if is_speaking:
+                    slots.append(len(speeches))
+                    speeches.append(None)
+                elif not found and not speaking_depth:
+                    # A <p> inside a <speaking> only matters for the fallback when that
+                    # <speaking> had no text, in which case the <p> has none either.
+                    slots.append(len(paras))
+                    paras.append(None)
+                else:
+                    slots.append(-1)
+                speaking_depth += is_speaking
+                continue
+            slot = slots.pop()
+            speaking_depth -= is_speaking
+            if is_speaking:
+                speaker = node.attrib.get('speaker') or node.attrib.get('speaker_name') or node.attrib.get('who') or ''
+                bioguide = (node.attrib.get('bioGuideId') or node.attrib.get('bioguide_id') or
+                            node.attrib.get('bioGuideID') or node.attrib.get('bioguideId') or '')
+                text = compact_whitespace(''.join(node.itertext()))
+                if text:
+                    speeches[slot] = {
+                        'speaker': speaker,
+                        'bioguide_id': bioguide,
+                        'text': text,
+                    }
+                    found = True
+            elif slot >= 0 and not found:
+                paras[slot] = compact_whitespace(''.join(node.itertext()))
+            # An enclosing <speaking>/<p> still needs this subtree for its own text.
+            if slots:
+                continue
+            node.clear()
+            parent = node.getparent()
+            if parent is not None:
+                while node.getprevious() is not None:
+                    del parent[0]
+    except ET.XMLSyntaxError:
+        return []
+
+    if found:
+        return [sp for sp in speeches if sp]
+    text = '\n\n'.join(t for t in paras if t)
+    return [{'speaker': '', 'bioguide_id': '', 'text': text}] if text else []
 
 
 def parse_page_from_granule_id(granule_id: str) -> Optional[str]:
-    m = re.search(r'(Pg[SH]\d+(?:-\d+)?)', granule_id or '')
+    m = _PAGE_RE.search(granule_id or '')
     return m.group(1) if m else None
 
 
+def _require_zstd() -> None:
+    if zstd is None:
+        raise SystemExit("Missing dependency: zstandard. Install with 'pip install zstandard'")
+
+
+def _open_jsonl_writer(path: str) -> BinaryIO:
+    if path.endswith('.zst'):
+        _require_zstd()
+        writer = zstd.ZstdCompressor(level=3, threads=-1).stream_writer(open(path, 'wb'))
+        return io.BufferedWriter(writer, buffer_size=1 << 20)
+    return open(path, 'wb', buffering=1 << 20)
+
+
+def _open_jsonl_reader(path: str) -> BinaryIO:
+    if path.endswith('.zst'):
+        _require_zstd()
+        return io.BufferedReader(zstd.ZstdDecompressor().stream_reader(open(path, 'rb')))
+    return open(path, 'rb')
+
+
+def _read_jsonl_table(jsonl_path: str, field_order: List[str]) -> Optional["pa.Table"]:
+    with _open_jsonl_reader(jsonl_path) as f:
+        if not f.read(1):
+            return None
+    schema = pa.schema([(name, pa.string()) for name in field_order])
+    table = pa_json.read_json(
+        jsonl_path,
+        read_options=pa_json.ReadOptions(block_size=16 << 20),
+        parse_options=pa_json.ParseOptions(explicit_schema=schema),
+    )
+    return table.select(field_order)
+
+
 def jsonl_to_csv(jsonl_path: str, csv_path: str, field_order: Optional[List[str]] = None) -> int:
-    import csv
+    if not field_order:
+        field_order = FIELD_ORDER
+    if pa is not None:
+        table = _read_jsonl_table(jsonl_path, field_order)
+        if table is None or not table.num_rows:
+            return 0
+        # Arrow's own CSV writer quotes every string and the header, so rows go through
+        # the csv module to keep the output identical to the non-pyarrow path.
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            w = csv.writer(f)
+            w.writerow(field_order)
+            for batch in table.to_batches():
+                w.writerows(zip(*(col.to_pylist() for col in batch.columns)))
+        return table.num_rows
+
     rows = []
-    with open(jsonl_path, 'r', encoding='utf-8') as f:
+    with _open_jsonl_reader(jsonl_path) as f:
         for line in f:
             if not line.strip():
                 continue
-            rows.append(json.loads(line))
+            rows.append(_loads(line))
     if not rows:
         return 0
-    if not field_order:
-        field_order = [
-            'date', 'chamber', 'speaker', 'bioguide_id', 'title', 'page', 'package_id', 'granule_id', 'text'
-        ]
     with open(csv_path, 'w', newline='', encoding='utf-8') as f:
         w = csv.DictWriter(f, fieldnames=field_order, extrasaction='ignore')
         w.writeheader()
@@ -150,32 +532,100 @@ def jsonl_to_csv(jsonl_path: str, csv_path: str, field_order: Optional[List[str]
     return len(rows)
 
 
+def jsonl_to_parquet(jsonl_path: str, parquet_path: str, field_order: Optional[List[str]] = None) -> int:
+    if pa is None:
+        raise SystemExit("Missing dependency: pyarrow. Install with 'pip install pyarrow'")
+    table = _read_jsonl_table(jsonl_path, field_order or FIELD_ORDER)
+    if table is None or not table.num_rows:
+        return 0
+    pa_parquet.write_table(table, parquet_path, compression='zstd')
+    return table.num_rows
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch Congressional Record speeches from GovInfo")
     parser.add_argument("--start", required=True, help="Start date YYYY-MM-DD")
     parser.add_argument("--end", required=True, help="End date YYYY-MM-DD (inclusive)")
     parser.add_argument("--out", default="data", help="Output directory (default: data)")
     parser.add_argument("--csv", action="store_true", help="Also write a CSV next to JSONL")
+    parser.add_argument("--zstd", action="store_true", help="Write zstd-compressed JSONL (.jsonl.zst; needs zstandard)")
+    parser.add_argument("--parquet", action="store_true", help="Also write a zstd-compressed Parquet file next to JSONL (needs pyarrow)")
     parser.add_argument("--max-packages", type=int, default=None, help="Limit number of packages (testing)")
     parser.add_argument("--max-granules", type=int, default=None, help="Limit granules per package (testing)")
-    parser.add_argument("--rate-delay", type=float, default=0.2, help="Delay between API calls (seconds)")
+    parser.add_argument("--max-rps", type=float, default=5.0, help="Maximum API requests per second (default: 5)")
+    parser.add_argument("--burst", type=int, default=10, help="Requests allowed in a burst above --max-rps (default: 10)")
+    parser.add_argument("--rate-delay", type=float, default=None, help="Deprecated: use --max-rps (sets it to 1 / RATE_DELAY)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent granule downloads (default: 8)")
+    parser.add_argument("--parse-procs", type=int, nargs="?", const=os.cpu_count() or 1, default=0,
+                        help="Parse XML in this many worker processes (default: off; bare flag uses all CPUs)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the on-disk granule cache")
+    parser.add_argument("--refresh", action="store_true", help="Re-download granules even if cached")
+    parser.add_argument("--cache-ttl", type=float, default=None, help="Re-download cached granules older than this many days")
     args = parser.parse_args()
+    if args.rate_delay is not None:
+        if args.rate_delay <= 0:
+            parser.error("--rate-delay must be > 0")
+        print("Note: --rate-delay is deprecated; use --max-rps instead.")
+        args.max_rps = 1 / args.rate_delay
+    if args.max_rps <= 0:
+        parser.error("--max-rps must be > 0")
+    if args.burst < 1:
+        parser.error("--burst must be >= 1")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.parse_procs < 0:
+        parser.error("--parse-procs must be >= 0")
 
     api_key = os.getenv("GOVINFO_API_KEY")
     if not api_key:
         raise SystemExit("Set GOVINFO_API_KEY environment variable with your GovInfo API key")
 
+    _limiter.configure(args.max_rps, args.burst)
+    _mount_adapter(_session, max(32, args.workers + 2))
     os.makedirs(args.out, exist_ok=True)
-    jsonl_path = os.path.join(args.out, f"speeches_{args.start}_to_{args.end}.jsonl")
+    jsonl_path = os.path.join(args.out, f"speeches_{args.start}_to_{args.end}.jsonl" + (".zst" if args.zstd else ""))
     csv_path = os.path.join(args.out, f"speeches_{args.start}_to_{args.end}.csv")
+    parquet_path = os.path.join(args.out, f"speeches_{args.start}_to_{args.end}.parquet")
+    cache_dir = None if args.no_cache else os.path.join(args.out, ".cache")
+    cache_ttl = 0.0 if args.refresh else (args.cache_ttl * 86400 if args.cache_ttl is not None else None)
 
     count_packages = 0
     count_granules = 0
     count_speeches = 0
 
+    def write_result(out: BinaryIO, fut: "Future[Optional[List[bytes]]]") -> None:
+        nonlocal count_granules, count_speeches
+        granule_id = pending.pop(fut)
+        try:
+            lines = fut.result()
+        except Exception as e:
+            print(f"  - Failed to fetch {granule_id}: {e}")
+            return
+        if lines is None:
+            return
+
+        out.writelines(lines)
+        count_speeches += len(lines)
+        count_granules += 1
+        if count_granules % 25 == 0:
+            print(f"  - Processed {count_granules} granules, {count_speeches} speeches so far...")
+
+    # Granules are submitted through one sliding window that spans package
+    # boundaries, so workers never idle waiting for a package's slowest granule.
+    pending: Dict["Future[Optional[List[bytes]]]", str] = {}
+    window = 2 * args.workers
+
     print(f"Fetching CREC packages {args.start} to {args.end}...")
-    with open(jsonl_path, 'w', encoding='utf-8') as out:
-        for p in iter_crec_packages(api_key, args.start, args.end, rate_delay=args.rate_delay):
+    with ExitStack() as stack:
+        out = stack.enter_context(_open_jsonl_writer(jsonl_path))
+        parse_pool = None
+        if args.parse_procs:
+            # spawn, not fork: the fetch threads are already running when workers start.
+            parse_pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=args.parse_procs, mp_context=multiprocessing.get_context("spawn")))
+        # Entered after parse_pool so it shuts down (and drains its fetch threads) first.
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=args.workers))
+        for p in iter_crec_packages(api_key, args.start, args.end, limit=args.max_packages):
             package_id = p.get('packageId')
             pkg_date = p.get('dateIssued')
             if not package_id:
@@ -183,48 +633,28 @@ def main():
             count_packages += 1
             print(f"Package {count_packages}: {package_id} ({pkg_date})")
             granules_seen = 0
-            for g in iter_granules(api_key, package_id, rate_delay=args.rate_delay):
+            for g in iter_granules(api_key, package_id, limit=args.max_granules):
                 granule_id = g.get('granuleId')
-                chamber = (g.get('granuleClass') or '').upper()
                 if not granule_id:
                     continue
                 granules_seen += 1
                 if args.max_granules and granules_seen > args.max_granules:
                     break
-
-                try:
-                    text, summary = fetch_granule_text(api_key, package_id, granule_id)
-                except Exception as e:
-                    print(f"  - Failed to fetch {granule_id}: {e}")
-                    continue
-                if not text:
-                    continue
-
-                speeches = extract_speeches_from_xml(text)
-                page = parse_page_from_granule_id(granule_id)
-                title = (summary.get('title') or g.get('title') or '').strip()
-
-                for sp in speeches:
-                    rec = {
-                        'date': pkg_date,
-                        'package_id': package_id,
-                        'granule_id': granule_id,
-                        'chamber': chamber,
-                        'page': page,
-                        'title': title,
-                        **sp,
-                    }
-                    out.write(json.dumps(rec, ensure_ascii=False) + "\n")
-                    count_speeches += 1
-
-                count_granules += 1
-                if count_granules % 25 == 0:
-                    print(f"  - Processed {count_granules} granules, {count_speeches} speeches so far...")
-                time.sleep(args.rate_delay)
+                while len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        write_result(out, fut)
+                fut = pool.submit(_granule_lines, api_key, package_id, pkg_date, g, cache_dir, cache_ttl, parse_pool)
+                pending[fut] = granule_id
 
             if args.max_packages and count_packages >= args.max_packages:
                 break
 
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                write_result(out, fut)
+
     print(f"Done. Packages: {count_packages}, granules: {count_granules}, speeches: {count_speeches}.")
     print(f"JSONL: {jsonl_path}")
 
@@ -232,6 +662,10 @@ def main():
         rows = jsonl_to_csv(jsonl_path, csv_path)
         print(f"CSV: {csv_path} ({rows} rows)")
 
+    if args.parquet:
+        rows = jsonl_to_parquet(jsonl_path, parquet_path)
+        print(f"Parquet: {parquet_path} ({rows} rows)")
+
 
 if __name__ == "__main__":
     main()